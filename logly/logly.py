@@ -16,11 +16,16 @@ along with Logly. If not, see <https://opensource.org/licenses/MIT>.
 """
 
 import os
+import sys
+import threading
+import time
+import weakref
 from colorama import Fore, Style, init
 from datetime import datetime
 import re
 
-from logly.exception import FilePathNotFoundException, FileAccessError, FileCreationError
+from logly.exception import (FilePathNotFoundException, FileAccessError, FileCreationError, InvalidConfigError,
+                             InvalidLogLevelError)
 
 init(autoreset=True)
 
@@ -32,7 +37,14 @@ class Logly:
     Attributes:
     - COLOR_MAP (dict): Mapping of log levels to color codes.
     - COLOR (class): Color constants for log messages.
+    - LEVEL_MAP (dict): Mapping of log levels to their severity.
+    - ANSI_ESCAPE_PATTERN (re.Pattern): Compiled pattern matching ANSI color codes.
     - DEFAULT_MAX_FILE_SIZE_MB (int): Default maximum file size in megabytes.
+    - DEFAULT_BUFFER_SIZE (int): Default write buffer size for log files in bytes.
+    - DEFAULT_FLUSH_INTERVAL (float): Default maximum time in seconds log messages stay buffered.
+    - DEFAULT_MAX_OPEN_FILES (int): Default number of log files kept open at once.
+    - FLUSH_LEVELS (frozenset): Log levels that are flushed to the log file immediately.
+    - SYNC_LEVELS (frozenset): Log levels that are also synced to disk immediately.
 
     Methods:
     - __init__: Initialize Logly instance.
@@ -42,11 +54,18 @@ class Logly:
     - enable_file_logging: Enable logging to a file.
     - set_default_file_path: Set default file path.
     - set_default_max_file_size: Set default maximum file size.
+    - set_level: Set the minimum log level.
+    - is_enabled_for: Check whether messages of a log level are logged.
+    - _is_enabled_for: Internal method to check an upper-case log level.
+    - flush: Flush buffered log messages to their log files.
+    - close: Flush and close all open log files.
     - get_current_datetime: Get current date and time as a formatted string.
     - remove_color_codes: Remove ANSI color codes from text.
     - _log: Internal method to log a message.
     - log_function: Log a message with exception handling.
+    - _log_function: Internal method to log a message without the level check.
     - info, warn, error, debug, critical, fatal, trace: Log messages with different levels.
+    - info_many: Log several messages with the INFO level in one call.
     - log: Log a message with the INFO level.
     """
 
@@ -69,10 +88,42 @@ class Logly:
         WHITE = Fore.WHITE
         GREEN = Fore.GREEN  # Added "LOG" level color
 
+    LEVEL_MAP = {
+        "TRACE": 5,
+        "DEBUG": 10,
+        "INFO": 20,
+        "LOG": 20,
+        "WARNING": 30,
+        "ERROR": 40,
+        "CRITICAL": 50,
+        "FATAL": 50
+    }
+    # Level name of every accepted set_level() argument, level names and their numeric severities.
+    # A severity shared by two names (e.g., 20 for INFO and LOG) maps to the first of them.
+    _LEVEL_NAMES = {**{severity: name for name, severity in reversed(LEVEL_MAP.items())},
+                    **{name: name for name in LEVEL_MAP}}
+
+    # Severities compared by the level wrappers, so they skip the LEVEL_MAP lookup on every call
+    _TRACE_NO = LEVEL_MAP["TRACE"]
+    _DEBUG_NO = LEVEL_MAP["DEBUG"]
+    _INFO_NO = LEVEL_MAP["INFO"]
+    _LOG_NO = LEVEL_MAP["LOG"]
+    _WARNING_NO = LEVEL_MAP["WARNING"]
+    _ERROR_NO = LEVEL_MAP["ERROR"]
+    _CRITICAL_NO = LEVEL_MAP["CRITICAL"]
+    _FATAL_NO = LEVEL_MAP["FATAL"]
+
+    ANSI_ESCAPE_PATTERN = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
     DEFAULT_MAX_FILE_SIZE_MB = 100  # 100MB
+    DEFAULT_BUFFER_SIZE = 64 * 1024  # 64KB
+    DEFAULT_FLUSH_INTERVAL = 1.0  # 1 second
+    DEFAULT_MAX_OPEN_FILES = 32
+    FLUSH_LEVELS = frozenset({"ERROR", "CRITICAL", "FATAL"})
+    SYNC_LEVELS = frozenset({"CRITICAL", "FATAL"})
     DEFAULT_COLOR_ENABLED = True  # Add a class attribute for controlling default Colorama behavior
 
-    def __init__(self, show_time=True, color_enabled=None):
+    def __init__(self, show_time=True, color_enabled=None, buffer_size=None, flush_interval=None, max_open_files=None):
         """
         Initialize a Logly instance.
 
@@ -83,6 +134,16 @@ class Logly:
         - default_file_path (str): Default file path for logging.
         - default_max_file_size (int): Default maximum file size for logging.
         - show_time (bool): Flag indicating whether to include timestamps in log messages.
+        - level (str): Name of the minimum log level, messages with a lower level are skipped. Setting it works
+                       like set_level().
+        - buffer_size (int): Write buffer size for log files in bytes, at least 2.
+        - flush_interval (float): Maximum time in seconds log messages stay buffered, a background timer flushes
+                                  them once the log files stay idle that long.
+        - max_open_files (int): Number of log files kept open at once, the least recently used one is closed
+                                when another one is opened.
+
+        Raises:
+        - InvalidConfigError: If buffer_size is below 2 or max_open_files is below 1.
         """
         self.logging_enabled = False
         self.log_to_file_enabled = True
@@ -90,8 +151,29 @@ class Logly:
         self.default_file_path = None
         self.default_max_file_size = self.DEFAULT_MAX_FILE_SIZE_MB
         self.show_time = show_time
+        self.set_level("TRACE")
         self.color_enabled = color_enabled if color_enabled is not None else self.DEFAULT_COLOR_ENABLED  # Use the provided value or default
         self.default_color_enabled = self.color_enabled  # Store the default color state
+        self.buffer_size = buffer_size if buffer_size is not None else self.DEFAULT_BUFFER_SIZE
+        # A buffer size of 1 turns on line buffering and 0 is refused for text files, so neither buffers anything
+        if self.buffer_size < 2:
+            raise InvalidConfigError(f"Invalid buffer size: {self.buffer_size}")
+        self.flush_interval = flush_interval if flush_interval is not None else self.DEFAULT_FLUSH_INTERVAL
+        self.max_open_files = max_open_files if max_open_files is not None else self.DEFAULT_MAX_OPEN_FILES
+        if self.max_open_files < 1:
+            raise InvalidConfigError(f"Invalid maximum number of open files: {self.max_open_files}")
+        self._last_flush = time.monotonic()
+        self._flush_timer = None  # Timer flushing buffered log messages once flush_interval has passed
+        self._timestamp_cache = (None, "")  # (second, formatted timestamp) of the last formatted timestamp
+        self._numbered_file_paths = {}  # Numbered file currently written to in place of each full log file
+        self._unsynced_file_paths = set()  # Log files written since they were last synced to disk
+        # Open log files, kept around so small writes are coalesced in the buffer, least recently used first
+        self._file_handles = {}
+        # Guards the open log files and their bookkeeping, reentrant because logging a message can flush
+        self._file_lock = threading.RLock()
+        self._file_sizes = {}  # Size in bytes of each open log file, including messages still in its buffer
+        # Flush and close the open log files when the instance is collected or the interpreter exits
+        weakref.finalize(self, self._close_file_handles, self._file_handles)
 
     def start_logging(self):
         """
@@ -102,15 +184,17 @@ class Logly:
 
     def stop_logging(self):
         """
-        Disable logging.
+        Disable logging. Messages are still displayed but no longer stored in the log file.
         """
         self.logging_enabled = False
+        self.flush()
 
     def disable_file_logging(self):
         """
         Disable logging to a file.
         """
         self.log_to_file_enabled = False
+        self.flush()
 
     def enable_file_logging(self):
         """
@@ -123,9 +207,10 @@ class Logly:
         Set the default file path.
 
         Parameters:
-        - file_path (str): The default file path.
+        - file_path (str or os.PathLike): The default file path.
         """
-        self.default_file_path = file_path
+        # Convert path-like objects once here instead of on every log call
+        self.default_file_path = os.fspath(file_path) if file_path is not None else None
 
     def set_default_max_file_size(self, max_file_size):
         """
@@ -136,6 +221,213 @@ class Logly:
         """
         self.default_max_file_size = max_file_size
 
+    def set_level(self, level):
+        """
+        Set the minimum log level. Messages with a lower level are skipped. The level attribute keeps
+        the upper-case level name.
+
+        Parameters:
+        - level (str or int): The minimum log level, either a case-insensitive name (e.g., "INFO", "error")
+                              or its severity from LEVEL_MAP (e.g., 20).
+        """
+        try:
+            level_name = self._LEVEL_NAMES.get(level.upper() if isinstance(level, str) else level)
+        except TypeError:
+            # Unhashable arguments (e.g., a list) can't be a log level either
+            level_name = None
+        if level_name is None:
+            raise InvalidLogLevelError(f"Invalid log level: {level}")
+        self._level = level_name
+        self._level_no = self.LEVEL_MAP[level_name]  # Severity of the minimum log level, compared on every log call
+
+    @property
+    def level(self):
+        """
+        Get the name of the minimum log level.
+
+        Returns:
+        - str: The upper-case level name.
+        """
+        return self._level
+
+    @level.setter
+    def level(self, level):
+        """
+        Set the minimum log level, like set_level().
+
+        Parameters:
+        - level (str or int): The minimum log level.
+        """
+        self.set_level(level)
+
+    def is_enabled_for(self, level):
+        """
+        Check whether messages of a log level are logged, so expensive messages can be skipped before building them.
+
+        Parameters:
+        - level (str or int): Log level, either a case-insensitive name (e.g., "INFO", "error") or a severity
+                              (e.g., 20). Custom levels, like other names or None, are always logged.
+
+        Returns:
+        - bool: True if messages of the log level are logged.
+        """
+        # Accept the same level names and severities as set_level()
+        return self._is_enabled_for(level.upper() if isinstance(level, str) else level)
+
+    def _is_enabled_for(self, level):
+        """
+        Internal method to check whether messages of a log level are logged, for callers that already
+        upper-cased the level name.
+
+        Parameters:
+        - level (str or int): Upper-case level name or severity.
+
+        Returns:
+        - bool: True if messages of the log level are logged.
+        """
+        if isinstance(level, str):
+            level_no = self.LEVEL_MAP.get(level)
+            return level_no is None or level_no >= self._level_no
+        if isinstance(level, int):
+            return level >= self._level_no
+        # Like custom level names, anything else is logged as is instead of failing the logging call
+        return True
+
+    def flush(self, sync=False):
+        """
+        Flush buffered log messages to their log files.
+
+        Parameters:
+        - sync (bool, optional): Whether to also sync the log files to disk. Defaults to False.
+        """
+        with self._file_lock:
+            self._last_flush = time.monotonic()
+            for log_file in self._file_handles.values():
+                log_file.flush()
+            if sync:
+                # Sync once every buffer has been handed to the OS so the syncs are not interleaved with writes.
+                # Only files written since their last sync need it, and fdatasync skips the metadata-only
+                # part of fsync on platforms that have it.
+                sync_file = getattr(os, "fdatasync", os.fsync)
+                for file_path in self._unsynced_file_paths:
+                    log_file = self._file_handles.get(file_path)
+                    if log_file is not None:
+                        sync_file(log_file.fileno())
+                self._unsynced_file_paths.clear()
+
+    def _start_flush_timer(self):
+        """
+        Start a daemon timer that flushes the buffered log messages once the flush interval has passed.
+        """
+        # The timer only keeps a weak reference, so a pending flush doesn't keep the instance alive
+        self._flush_timer = threading.Timer(self.flush_interval, self._flush_from_timer, args=(weakref.ref(self),))
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    @staticmethod
+    def _flush_from_timer(logly_ref):
+        """
+        Flush the buffered log messages of a Logly instance from its flush timer.
+
+        Parameters:
+        - logly_ref (weakref.ref): Weak reference to the Logly instance.
+        """
+        logly = logly_ref()
+        if logly is not None:
+            with logly._file_lock:
+                logly._flush_timer = None
+                logly.flush()
+
+    def close(self):
+        """
+        Flush and close all open log files, syncing the ones written since their last sync to disk. They are
+        opened again by the next message logged to them.
+        """
+        with self._file_lock:
+            for file_path in list(self._file_handles):
+                self._close_file_handle(file_path)
+
+    @staticmethod
+    def _close_file_handles(file_handles):
+        """
+        Close the given log files, flushing any buffered log messages.
+
+        Parameters:
+        - file_handles (dict): Mapping of file paths to open log files.
+        """
+        for log_file in file_handles.values():
+            log_file.close()
+        file_handles.clear()
+
+    def _close_file_handle(self, file_path):
+        """
+        Flush and close the open log file for a file path, if any, and drop its bookkeeping. A log file written
+        since its last sync is synced to disk first, since flush(sync=True) only reaches open log files.
+
+        Parameters:
+        - file_path (str): File path for logging.
+        """
+        log_file = self._file_handles.pop(file_path, None)
+        if log_file is not None:
+            if file_path in self._unsynced_file_paths:
+                log_file.flush()
+                getattr(os, "fdatasync", os.fsync)(log_file.fileno())
+            log_file.close()
+        self._file_sizes.pop(file_path, None)
+        self._unsynced_file_paths.discard(file_path)
+
+    def _get_file_handle(self, file_path):
+        """
+        Get the open log file for a file path, opening it in append mode if needed. Once max_open_files log
+        files are open, the least recently used one is closed first.
+
+        Parameters:
+        - file_path (str): File path for logging.
+
+        Returns:
+        - file: The buffered log file.
+        """
+        log_file = self._file_handles.pop(file_path, None)
+        if log_file is None:
+            if len(self._file_handles) >= self.max_open_files:
+                self._close_file_handle(next(iter(self._file_handles)))
+            log_file = open(file_path, "a", buffering=self.buffer_size)
+            self._file_sizes[file_path] = os.path.getsize(file_path)
+        # Move the log file to the end, so the first one is always the least recently used
+        self._file_handles[file_path] = log_file
+        return log_file
+
+    def _write_to_file(self, file_path, line):
+        """
+        Write a line to a log file through its buffer and count its size in bytes.
+
+        Parameters:
+        - file_path (str): File path for logging.
+        - line (str): The line to write, ending with a newline.
+        """
+        log_file = self._get_file_handle(file_path)
+        log_file.write(line)
+        size = len(line) if line.isascii() else len(line.encode(log_file.encoding, log_file.errors))
+        if os.linesep != "\n":
+            # Text mode writes every newline as os.linesep
+            size += line.count("\n") * (len(os.linesep) - 1)
+        self._file_sizes[file_path] += size
+
+    def _get_file_size(self, file_path):
+        """
+        Get the size of a log file in bytes, including messages still held in its buffer.
+
+        Parameters:
+        - file_path (str): File path for logging.
+
+        Returns:
+        - int: The size of the log file.
+        """
+        # Count the bytes written instead of asking the open file, its tell() would flush the buffer first
+        if file_path in self._file_handles:
+            return self._file_sizes[file_path]
+        return os.path.getsize(file_path) if os.path.exists(file_path) else 0
+
     def get_current_datetime(self):
         """
         Get the current date and time as a formatted string.
@@ -143,7 +435,13 @@ class Logly:
         Returns:
         - str: Formatted date and time string.
         """
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # The timestamp only has second precision, so reuse it until the second changes
+        second = int(time.time())
+        cached_second, timestamp = self._timestamp_cache
+        if second != cached_second:
+            timestamp = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+            self._timestamp_cache = (second, timestamp)
+        return timestamp
 
     def remove_color_codes(self, text):
         """
@@ -155,10 +453,37 @@ class Logly:
         Returns:
         - str: Text with color codes removed.
         """
-        return re.sub(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])', '', text)
+        return self.ANSI_ESCAPE_PATTERN.sub('', text)
+
+    def _get_numbered_file_path(self, file_path):
+        """
+        Get the first file path with a number appended (e.g., "log_1.txt") that does not exist yet.
+
+        Parameters:
+        - file_path (str): File path for logging.
+
+        Returns:
+        - str: The numbered file path.
+        """
+        file_dir, file_name = os.path.split(file_path)
+        file_base, file_ext = os.path.splitext(file_name)
+        # Compare names with normcase so case-insensitive file systems match like os.path.exists() does
+        prefix = os.path.normcase(f"{file_base}_")
+        suffix = os.path.normcase(file_ext)
+
+        # Read the directory once instead of checking every numbered file name with a separate stat
+        with os.scandir(file_dir or os.curdir) as entries:
+            names = (os.path.normcase(entry.name) for entry in entries)
+            taken = {name[len(prefix):len(name) - len(suffix)] for name in names
+                     if name.startswith(prefix) and name.endswith(suffix)}
+
+        count = 1
+        while str(count) in taken:
+            count += 1
+        return os.path.join(file_dir, f"{file_base}_{count}{file_ext}")
 
     def _log(self, level, key, value, color=None, log_to_file=True, file_path=None, file_name=None, max_file_size=None,
-             auto=True, show_time=None, color_enabled=None):
+             auto=True, show_time=None, color_enabled=None, level_name=None):
         """
         Internal method to log a message.
 
@@ -168,42 +493,48 @@ class Logly:
         - value (str): The value of the log message.
         - color (str): ANSI color code for the log message.
         - log_to_file (bool): Whether to log to a file.
-        - file_path (str): File path for logging.
+        - file_path (str or os.PathLike): File path for logging.
         - file_name (str): File name for logging.
         - max_file_size (int): Maximum file size for logging.
         - auto (bool): Whether to auto-delete log file data when the size limit is reached.
         - show_time (bool): Whether to include timestamps in the log message.
         - color_enabled (bool): Whether to enable color in the log message.
+        - level_name (str): Upper-case name of the log level for the flush policy. Defaults to level.
 
         """
         color_enabled = color_enabled if color_enabled is not None else self.color_enabled  # Use the provided value or default
         if show_time is None:
             show_time = self.show_time
 
-        timestamp = "" if not show_time else self.get_current_datetime()
+        # Build the plain prefix and message once, the console line only wraps the message in color
+        if show_time:
+            prefix = f"[{self.get_current_datetime()}] {level}: "
+        elif color_enabled:
+            prefix = f" {level}: "
+        else:
+            prefix = f"{level}: "
+        message = f"{key}: {value}"
 
-        if color_enabled and show_time:
-            # Apply color if both color and time are enabled
-            color = color or self.COLOR_MAP.get(level, self.COLOR.BLUE)
-            log_message = f"[{timestamp}] {level}: {color}{key}: {value}{Style.RESET_ALL}"
-        elif color_enabled and not show_time:
-            # Apply color if only color is enabled
+        if color_enabled:
             color = color or self.COLOR_MAP.get(level, self.COLOR.BLUE)
-            log_message = f" {level}: {color}{key}: {value}{Style.RESET_ALL}"
-        elif not color_enabled and show_time:
-            # Do not apply color, but include timestamp if only time is enabled
-            log_message = f"[{timestamp}] {level}: {key}: {value}"
+            log_message = f"{prefix}{color}{message}{Style.RESET_ALL}"
         else:
-            # Do not apply color or timestamp if neither is enabled
-            log_message = f"{level}: {key}: {value}"
+            log_message = f"{prefix}{message}"
 
-        # Log to console
-        print(log_message)
+        # Log to console with a single write, the same line is kept in logged_messages
+        log_line = f"{log_message}\n"
+        stdout = sys.stdout
+        # Like print(), skip the console when there is none (e.g., pythonw on Windows)
+        if stdout is not None:
+            stdout.write(log_line)
 
-        if self.log_to_file_enabled and log_to_file:
+        # Skip the whole file path while logging is stopped, the message is only displayed
+        if self.logging_enabled and self.log_to_file_enabled and log_to_file:
             try:
-                # Remove color codes before storing in the log file
-                log_message_without_color = self.remove_color_codes(log_message)
+                # Store the log file line without color codes, only strip them when the message carries its own
+                if "\x1b" in message:
+                    message = self.remove_color_codes(message)
+                log_line_without_color = f"{prefix}{message}\n"
 
                 # Determine the file path and name
                 if file_path is None:
@@ -212,43 +543,72 @@ class Logly:
                 elif file_name:
                     file_path = os.path.join(os.getcwd(),
                                              f"{file_name}.txt")  # Use the provided file name in the project root
-
-                # Create the directories if they don't exist
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-                # Check if the file path exists
-                if not os.path.exists(os.path.dirname(file_path)):
-                    raise FilePathNotFoundException(
-                        f"The specified file path does not exist: {os.path.dirname(file_path)}")
-
-                # Set the default max_file_size if not provided
-                max_file_size = max_file_size or self.default_max_file_size
-
-                # Convert max_file_size to bytes
-                max_file_size_bytes = max_file_size * 1024 * 1024
-
-                # Check if the file exists
-                file_exists = os.path.exists(file_path)
-
-                # Check if the file size limit is reached
-                if max_file_size and file_exists and os.path.getsize(file_path) >= max_file_size_bytes:
-                    if auto:
-                        # Auto-delete log file data by truncating the file
-                        with open(file_path, 'w'):
-                            pass
+                else:
+                    file_path = os.fspath(file_path)  # Accept path-like objects, keyed the same as their string path
+                # Key the open log files by absolute path, so every spelling of a path shares one open file
+                # and relative paths follow the current directory
+                file_path = os.path.abspath(file_path)
+
+                # Check, open and write the log file under the lock so threads logging at the same time
+                # don't open a file twice or change the open files while another thread flushes them
+                with self._file_lock:
+                    # Set the default max_file_size if not provided
+                    max_file_size = max_file_size or self.default_max_file_size
+
+                    # Convert max_file_size to bytes
+                    max_file_size_bytes = max_file_size * 1024 * 1024
+
+                    numbered_file_path = self._numbered_file_paths.get(file_path)
+                    if not auto and file_path not in self._file_handles and numbered_file_path in self._file_handles:
+                        # The log file was already full and closed, messages go to its open numbered file,
+                        # so skip the directory and size checks of the full log file
+                        file_full = True
                     else:
-                        # Find the next available file name with a number appended
-                        file_base, file_ext = os.path.splitext(file_path)
-                        count = 1
-                        while os.path.exists(f"{file_base}_{count}{file_ext}"):
-                            count += 1
-                        file_path = f"{file_base}_{count}{file_ext}"
-
-                # Open the file in appended mode, creating it if it doesn't exist
-                with open(file_path, "a" if file_exists else "w") as log_file:
-                    log_file.write(log_message_without_color + "\n")
-
-                self.logged_messages.append(log_message + "\n")
+                        # An open log file already has its directory, only check it for files not opened yet
+                        if file_path not in self._file_handles:
+                            # Create the directories if they don't exist
+                            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+                            # Check if the file path exists
+                            if not os.path.exists(os.path.dirname(file_path)):
+                                raise FilePathNotFoundException(
+                                    f"The specified file path does not exist: {os.path.dirname(file_path)}")
+
+                        # Check if the file size limit is reached
+                        file_full = max_file_size and self._get_file_size(file_path) >= max_file_size_bytes
+
+                    if file_full:
+                        if auto:
+                            # Auto-delete log file data by truncating the file
+                            self._close_file_handle(file_path)
+                            with open(file_path, 'w'):
+                                pass
+                        else:
+                            # Keep writing to the current numbered file and only look for the next available
+                            # file name with a number appended once that one is full too
+                            if (numbered_file_path is None
+                                    or self._get_file_size(numbered_file_path) >= max_file_size_bytes):
+                                # The full file is no longer written to, so close it instead of leaking its handle
+                                self._close_file_handle(numbered_file_path or file_path)
+                                numbered_file_path = self._get_numbered_file_path(file_path)
+                                self._numbered_file_paths[file_path] = numbered_file_path
+                            file_path = numbered_file_path
+
+                    # Write through the buffered log file, creating it if it doesn't exist
+                    self._write_to_file(file_path, log_line_without_color)
+                    self._unsynced_file_paths.add(file_path)
+
+                    # Flush severe levels right away and everything else at least once per flush interval,
+                    # the most severe levels are also synced so they survive a crash
+                    if level_name is None:
+                        level_name = level
+                    if level_name in self.FLUSH_LEVELS or time.monotonic() - self._last_flush >= self.flush_interval:
+                        self.flush(sync=level_name in self.SYNC_LEVELS)
+                    elif self._flush_timer is None:
+                        # Flush the buffer even if no other message is logged before the flush interval passes
+                        self._start_flush_timer()
+
+                self.logged_messages.append(log_line)
 
             except (FileNotFoundError, PermissionError) as e:
                 raise FileAccessError(f"Error accessing the log file: {e}")
@@ -267,12 +627,39 @@ class Logly:
         - value (str, optional): The value of the log message. Defaults to None.
         - color (str, optional): ANSI color code for the log message. Defaults to None.
         - log_to_file (bool, optional): Whether to log to a file. Defaults to True.
-        - file_path (str, optional): File path for logging. Defaults to None.
+        - file_path (str or os.PathLike, optional): File path for logging. Defaults to None.
         - file_name (str, optional): File name for logging. Defaults to None.
         - max_file_size (int, optional): Maximum file size for logging. Defaults to None.
         - auto (bool, optional): Whether to auto-delete log file data when the size limit is reached. Defaults to True.
         - show_time (bool, optional): Whether to include timestamps in the log message. Defaults to None.
         """
+        # Upper-case the level name once for the level check and the flush policy, so log_function("error", ...)
+        # is flushed like error() while the message keeps the level as given
+        level_name = level.upper() if isinstance(level, str) else level
+        # Skip messages below the minimum log level before doing any work
+        if self._is_enabled_for(level_name):
+            self._log_function(level, key_or_value, value, color, log_to_file, file_path, file_name, max_file_size,
+                               auto, show_time, color_enabled, level_name)
+
+    def _log_function(self, level, key_or_value, value=None, color=None, log_to_file=True, file_path=None,
+                      file_name=None, max_file_size=None, auto=True, show_time=None, color_enabled=None,
+                      level_name=None):
+        """
+        Internal method to log a message without checking the minimum log level, for callers that already did.
+
+        Parameters:
+        - level (str): Log level (e.g., "INFO", "ERROR").
+        - key_or_value (str): The key if a value is provided, otherwise the value.
+        - value (str, optional): The value of the log message. Defaults to None.
+        - color (str, optional): ANSI color code for the log message. Defaults to None.
+        - log_to_file (bool, optional): Whether to log to a file. Defaults to True.
+        - file_path (str or os.PathLike, optional): File path for logging. Defaults to None.
+        - file_name (str, optional): File name for logging. Defaults to None.
+        - max_file_size (int, optional): Maximum file size for logging. Defaults to None.
+        - auto (bool, optional): Whether to auto-delete log file data when the size limit is reached. Defaults to True.
+        - show_time (bool, optional): Whether to include timestamps in the log message. Defaults to None.
+        - level_name (str, optional): Upper-case name of the log level for the flush policy. Defaults to level.
+        """
         if value is None:
             # If only one parameter is provided, consider it as the value, and set key to None
             key = None
@@ -282,7 +669,7 @@ class Logly:
             key = key_or_value
 
         self._log(level, key, value, color, log_to_file, file_path, file_name, max_file_size, auto, show_time,
-                  color_enabled)
+                  color_enabled, level_name)
 
     def info(self, key_or_value, value=None, color=None, log_to_file=True, file_path=None, file_name=None,
              max_file_size=None, auto=True, show_time=None, color_enabled=None):
@@ -295,14 +682,42 @@ class Logly:
         - value (str, optional): The value of the log message. Defaults to None.
         - color (str, optional): ANSI color code for the log message. Defaults to None.
         - log_to_file (bool, optional): Whether to log to a file. Defaults to True.
-        - file_path (str, optional): File path for logging. Defaults to None.
+        - file_path (str or os.PathLike, optional): File path for logging. Defaults to None.
         - file_name (str, optional): File name for logging. Defaults to None.
         - max_file_size (int, optional): Maximum file size for logging. Defaults to None.
         - auto (bool, optional): Whether to auto-delete log file data when the size limit is reached. Defaults to True.
         - show_time (bool, optional): Whether to include timestamps in the log message. Defaults to None.
         """
-        self.log_function("INFO", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size, auto,
-                          show_time, color_enabled)
+        if self._level_no <= self._INFO_NO:
+            self._log_function("INFO", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size,
+                               auto, show_time, color_enabled)
+
+    def info_many(self, messages, color=None, log_to_file=True, file_path=None, file_name=None, max_file_size=None,
+                  auto=True, show_time=None, color_enabled=None):
+        """
+        Log several messages with the INFO level in one call.
+
+        Parameters:
+        - messages (iterable): The messages to log. Each message is either a (key, value) tuple or a value, in
+                               which case the key is set to None. Tuples of any other length are logged as values,
+                               and a (key, None) tuple is logged like info(key, None).
+        - color (str, optional): ANSI color code for the log messages. Defaults to None.
+        - log_to_file (bool, optional): Whether to log to a file. Defaults to True.
+        - file_path (str or os.PathLike, optional): File path for logging. Defaults to None.
+        - file_name (str, optional): File name for logging. Defaults to None.
+        - max_file_size (int, optional): Maximum file size for logging. Defaults to None.
+        - auto (bool, optional): Whether to auto-delete log file data when the size limit is reached. Defaults to True.
+        - show_time (bool, optional): Whether to include timestamps in the log messages. Defaults to None.
+        """
+        # Check the level once for the whole batch instead of once per message
+        if not self.is_enabled_for("INFO"):
+            return
+
+        for message in messages:
+            # Only (key, value) pairs are split, any other value is logged as is like info() does
+            key_or_value, value = message if isinstance(message, tuple) and len(message) == 2 else (message, None)
+            self._log_function("INFO", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size,
+                               auto, show_time, color_enabled)
 
     def warn(self, key_or_value, value=None, color=None, log_to_file=True, file_path=None, file_name=None,
              max_file_size=None, auto=True, show_time=None, color_enabled=None):
@@ -315,14 +730,15 @@ class Logly:
         - value (str, optional): The value of the log message. Defaults to None.
         - color (str, optional): ANSI color code for the log message. Defaults to None.
         - log_to_file (bool, optional): Whether to log to a file. Defaults to True.
-        - file_path (str, optional): File path for logging. Defaults to None.
+        - file_path (str or os.PathLike, optional): File path for logging. Defaults to None.
         - file_name (str, optional): File name for logging. Defaults to None.
         - max_file_size (int, optional): Maximum file size for logging. Defaults to None.
         - auto (bool, optional): Whether to auto-delete log file data when the size limit is reached. Defaults to True.
         - show_time (bool, optional): Whether to include timestamps in the log message. Defaults to None.
         """
-        self.log_function("WARNING", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size, auto,
-                          show_time, color_enabled)
+        if self._level_no <= self._WARNING_NO:
+            self._log_function("WARNING", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size,
+                               auto, show_time, color_enabled)
 
     def error(self, key_or_value, value=None, color=None, log_to_file=True, file_path=None, file_name=None,
               max_file_size=None, auto=True, show_time=None, color_enabled=None):
@@ -335,14 +751,15 @@ class Logly:
         - value (str, optional): The value of the log message. Defaults to None.
         - color (str, optional): ANSI color code for the log message. Defaults to None.
         - log_to_file (bool, optional): Whether to log to a file. Defaults to True.
-        - file_path (str, optional): File path for logging. Defaults to None.
+        - file_path (str or os.PathLike, optional): File path for logging. Defaults to None.
         - file_name (str, optional): File name for logging. Defaults to None.
         - max_file_size (int, optional): Maximum file size for logging. Defaults to None.
         - auto (bool, optional): Whether to auto-delete log file data when the size limit is reached. Defaults to True.
         - show_time (bool, optional): Whether to include timestamps in the log message. Defaults to None.
         """
-        self.log_function("ERROR", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size, auto,
-                          show_time, color_enabled)
+        if self._level_no <= self._ERROR_NO:
+            self._log_function("ERROR", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size,
+                               auto, show_time, color_enabled)
 
     def debug(self, key_or_value, value=None, color=None, log_to_file=True, file_path=None, file_name=None,
               max_file_size=None, auto=True, show_time=None, color_enabled=None):
@@ -355,14 +772,15 @@ class Logly:
         - value (str, optional): The value of the log message. Defaults to None.
         - color (str, optional): ANSI color code for the log message. Defaults to None.
         - log_to_file (bool, optional): Whether to log to a file. Defaults to True.
-        - file_path (str, optional): File path for logging. Defaults to None.
+        - file_path (str or os.PathLike, optional): File path for logging. Defaults to None.
         - file_name (str, optional): File name for logging. Defaults to None.
         - max_file_size (int, optional): Maximum file size for logging. Defaults to None.
         - auto (bool, optional): Whether to auto-delete log file data when the size limit is reached. Defaults to True.
         - show_time (bool, optional): Whether to include timestamps in the log message. Defaults to None.
         """
-        self.log_function("DEBUG", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size, auto,
-                          show_time, color_enabled)
+        if self._level_no <= self._DEBUG_NO:
+            self._log_function("DEBUG", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size,
+                               auto, show_time, color_enabled)
 
     def critical(self, key_or_value, value=None, color=None, log_to_file=True, file_path=None, file_name=None,
                  max_file_size=None, auto=True, show_time=None, color_enabled=None):
@@ -375,15 +793,15 @@ class Logly:
         - value (str, optional): The value of the log message. Defaults to None.
         - color (str, optional): ANSI color code for the log message. Defaults to None.
         - log_to_file (bool, optional): Whether to log to a file. Defaults to True.
-        - file_path (str, optional): File path for logging. Defaults to None.
+        - file_path (str or os.PathLike, optional): File path for logging. Defaults to None.
         - file_name (str, optional): File name for logging. Defaults to None.
         - max_file_size (int, optional): Maximum file size for logging. Defaults to None.
         - auto (bool, optional): Whether to auto-delete log file data when the size limit is reached. Defaults to True.
         - show_time (bool, optional): Whether to include timestamps in the log message. Defaults to None.
         """
-        self.log_function("CRITICAL", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size,
-                          auto,
-                          show_time, color_enabled)
+        if self._level_no <= self._CRITICAL_NO:
+            self._log_function("CRITICAL", key_or_value, value, color, log_to_file, file_path, file_name,
+                               max_file_size, auto, show_time, color_enabled)
 
     def fatal(self, key_or_value, value=None, color=None, log_to_file=True, file_path=None, file_name=None,
               max_file_size=None, auto=True, show_time=None, color_enabled=None):
@@ -396,14 +814,15 @@ class Logly:
         - value (str, optional): The value of the log message. Defaults to None.
         - color (str, optional): ANSI color code for the log message. Defaults to None.
         - log_to_file (bool, optional): Whether to log to a file. Defaults to True.
-        - file_path (str, optional): File path for logging. Defaults to None.
+        - file_path (str or os.PathLike, optional): File path for logging. Defaults to None.
         - file_name (str, optional): File name for logging. Defaults to None.
         - max_file_size (int, optional): Maximum file size for logging. Defaults to None.
         - auto (bool, optional): Whether to auto-delete log file data when the size limit is reached. Defaults to True.
         - show_time (bool, optional): Whether to include timestamps in the log message. Defaults to None.
         """
-        self.log_function("FATAL", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size, auto,
-                          show_time, color_enabled)
+        if self._level_no <= self._FATAL_NO:
+            self._log_function("FATAL", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size,
+                               auto, show_time, color_enabled)
 
     def trace(self, key_or_value, value=None, color=None, log_to_file=True, file_path=None, file_name=None,
               max_file_size=None, auto=True, show_time=None, color_enabled=None):
@@ -416,14 +835,15 @@ class Logly:
         - value (str, optional): The value of the log message. Defaults to None.
         - color (str, optional): ANSI color code for the log message. Defaults to None.
         - log_to_file (bool, optional): Whether to log to a file. Defaults to True.
-        - file_path (str, optional): File path for logging. Defaults to None.
+        - file_path (str or os.PathLike, optional): File path for logging. Defaults to None.
         - file_name (str, optional): File name for logging. Defaults to None.
         - max_file_size (int, optional): Maximum file size for logging. Defaults to None.
         - auto (bool, optional): Whether to auto-delete log file data when the size limit is reached. Defaults to True.
         - show_time (bool, optional): Whether to include timestamps in the log message. Defaults to None.
         """
-        self.log_function("TRACE", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size, auto,
-                          show_time, color_enabled)
+        if self._level_no <= self._TRACE_NO:
+            self._log_function("TRACE", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size,
+                               auto, show_time, color_enabled)
 
     def log(self, key_or_value, value=None, color=None, log_to_file=True, file_path=None, file_name=None,
             max_file_size=None, auto=True, show_time=None, color_enabled=None):
@@ -436,11 +856,12 @@ class Logly:
         - value (str, optional): The value of the log message. Defaults to None.
         - color (str, optional): ANSI color code for the log message. Defaults to None.
         - log_to_file (bool, optional): Whether to log to a file. Defaults to True.
-        - file_path (str, optional): File path for logging. Defaults to None.
+        - file_path (str or os.PathLike, optional): File path for logging. Defaults to None.
         - file_name (str, optional): File name for logging. Defaults to None.
         - max_file_size (int, optional): Maximum file size for logging. Defaults to None.
         - auto (bool, optional): Whether to auto-delete log file data when the size limit is reached. Defaults to True.
         - show_time (bool, optional): Whether to include timestamps in the log message. Defaults to None.
         """
-        self.log_function("LOG", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size, auto,
-                          show_time, color_enabled)
+        if self._level_no <= self._LOG_NO:
+            self._log_function("LOG", key_or_value, value, color, log_to_file, file_path, file_name, max_file_size,
+                               auto, show_time, color_enabled)
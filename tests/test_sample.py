@@ -15,9 +15,14 @@ along with Logly. If not, see <https://opensource.org/licenses/MIT>.
 """
 
 import os
+import sys
+import threading
+import time
+
 import pytest
 
 from logly import Logly
+from logly.exception import InvalidConfigError, InvalidLogLevelError
 
 @pytest.fixture
 def logly_instance():
@@ -31,13 +36,17 @@ def logly_instance():
     logly.start_logging()
     return logly
 
-def test_logly_integration(logly_instance):
+def test_logly_integration(logly_instance, tmp_path, monkeypatch):
     """
     Test the integration of Logly by logging messages with different levels and colors.
 
     Parameters:
     - logly_instance (Logly): The Logly instance created by the fixture.
+    - tmp_path (Path): Temporary directory provided by pytest.
+    - monkeypatch (MonkeyPatch): Changes the current directory for the test, so the log files end up in tmp_path.
     """
+    monkeypatch.chdir(tmp_path)
+
     # Log messages with different levels and colors
     logly_instance.info("Key1", "Value1", color=logly_instance.COLOR.CYAN)
     logly_instance.warn("Key2", "Value2", color=logly_instance.COLOR.YELLOW)
@@ -61,7 +70,7 @@ def test_logly_integration(logly_instance):
     # Stop logging
     logly_instance.stop_logging()
 
-    # Log more messages after stopping logging (these won't be displayed or logged)
+    # Log more messages after stopping logging (these are displayed but not stored in the log file)
     logly_instance.info("AnotherKey1", "AnotherValue1", color=logly_instance.COLOR.CYAN)
     logly_instance.warn("AnotherKey2", "AnotherValue2", color=logly_instance.COLOR.YELLOW)
     logly_instance.error("AnotherKey3", "AnotherValue3", color=logly_instance.COLOR.RED)
@@ -90,4 +99,419 @@ def test_logly_integration(logly_instance):
     for message in logly_instance.logged_messages:
         print(message)
 
+    # Every message is stored except the ones logged while stopped or with log_to_file=False
+    assert len(logly_instance.logged_messages) == 18
+    assert not any("AnotherKey" in message or "DefaultKey3" in message for message in logly_instance.logged_messages)
+
+
+def test_buffered_file_logging(tmp_path):
+    """
+    Test that buffered log messages reach the log file once flushed.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    """
+    logly = Logly(show_time=False, color_enabled=False)
+    logly.start_logging()
+    log_path = tmp_path / "log.txt"
+
+    logly.info("Key1", "Value1", file_path=str(log_path))
+    logly.warn("Key2", "Value2", file_path=log_path)
+    logly.flush(sync=True)
+
+    assert log_path.read_text().splitlines() == ["INFO: Key1: Value1", "WARNING: Key2: Value2"]
+
+
+def test_messages_stay_buffered_until_flush(tmp_path):
+    """
+    Test that messages below the flush levels stay in the buffer until flushed.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    """
+    logly = Logly(show_time=False, color_enabled=False, flush_interval=60)
+    logly.start_logging()
+    log_path = tmp_path / "log.txt"
+
+    for count in range(1, 6):
+        logly.info(f"Key{count}", f"Value{count}", file_path=log_path)
+    assert log_path.read_text() == ""
+
+    logly.flush()
+
+    assert log_path.read_text().splitlines() == [f"INFO: Key{count}: Value{count}" for count in range(1, 6)]
+
+
+def test_idle_messages_flushed_after_interval(tmp_path):
+    """
+    Test that buffered messages are flushed once the flush interval passes without another message.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    """
+    logly = Logly(show_time=False, color_enabled=False, flush_interval=0.2)
+    logly.start_logging()
+    log_path = tmp_path / "log.txt"
+
+    logly.info("Key1", "Value1", file_path=log_path)
+    assert log_path.read_text() == ""
+
+    deadline = time.monotonic() + 5
+    while log_path.read_text() == "" and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert log_path.read_text().splitlines() == ["INFO: Key1: Value1"]
+    logly.close()
+
+def test_relative_file_path_shares_log_file(tmp_path, monkeypatch):
+    """
+    Test that a relative file path and the default file path for the same log file keep the message order.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    - monkeypatch (MonkeyPatch): Changes the current directory for the test.
+    """
+    monkeypatch.chdir(tmp_path)
+    logly = Logly(show_time=False, color_enabled=False)
+    logly.start_logging()
+
+    logly.info("Key1", "Value1")
+    logly.info("Key2", "Value2", file_path="./log.txt")
+    logly.info("Key3", "Value3")
+    logly.info("Key4", "Value4", file_path="log.txt")
+    logly.close()
+
+    assert (tmp_path / "log.txt").read_text().splitlines() == [f"INFO: Key{count}: Value{count}"
+                                                                for count in range(1, 5)]
+
+def test_stopped_logging_skips_file(tmp_path):
+    """
+    Test that messages logged while logging is stopped are displayed but not stored in the log file.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    """
+    logly = Logly(show_time=False, color_enabled=False)
+    log_path = tmp_path / "log.txt"
+
+    logly.info("Key1", "Value1", file_path=str(log_path))
+    logly.start_logging()
+    logly.info("Key2", "Value2", file_path=str(log_path))
+    logly.stop_logging()
+    logly.info("Key3", "Value3", file_path=str(log_path))
+    logly.flush()
+
+    assert log_path.read_text().splitlines() == ["INFO: Key2: Value2"]
+    assert len(logly.logged_messages) == 1
+
+
+def test_severe_levels_flush_immediately(tmp_path):
+    """
+    Test that error messages are flushed to the log file without an explicit flush.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    """
+    logly = Logly(show_time=False, color_enabled=False, flush_interval=60)
+    logly.start_logging()
+    log_path = tmp_path / "log.txt"
+
+    logly.info("Key1", "Value1", file_path=str(log_path))
+    logly.info("Key2", "Value2", file_path=str(log_path))
+    assert log_path.read_text() == ""
+
+    logly.error("Key3", "Value3", file_path=str(log_path))
+    assert log_path.read_text().splitlines() == ["INFO: Key1: Value1", "INFO: Key2: Value2", "ERROR: Key3: Value3"]
+
+    logly.log_function("error", "Key4", "Value4", file_path=str(log_path))
+    assert log_path.read_text().splitlines()[-1] == "error: Key4: Value4"
+
+
+def test_concurrent_logging(tmp_path, capsys):
+    """
+    Test that threads logging to new log files and syncing them at the same time don't break each other, and that
+    only a few of the log files are kept open.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    - capsys (CaptureFixture): Captures console output.
+    """
+    logly = Logly(show_time=False, color_enabled=False, max_open_files=16)
+    logly.start_logging()
+    errors = []
+    logging_done = threading.Event()
+
+    def log_to_new_files(thread):
+        try:
+            for count in range(100):
+                logly.error("Key", "Value", file_path=tmp_path / f"log_{thread}_{count}.txt")
+                # Least recently used log files are closed as new ones are opened
+                assert len(logly._file_handles) <= logly.max_open_files
+        except Exception as e:
+            errors.append(e)
+
+    def sync_log_files():
+        try:
+            while not logging_done.is_set():
+                logly.flush(sync=True)
+        except Exception as e:
+            errors.append(e)
+
+    # Switch threads as often as possible so they interleave inside the file handling
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        sync_thread = threading.Thread(target=sync_log_files)
+        sync_thread.start()
+        threads = [threading.Thread(target=log_to_new_files, args=(thread,)) for thread in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logging_done.set()
+        sync_thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    logly.close()
+
+    assert errors == []
+    assert len(list(tmp_path.iterdir())) == 8 * 100
+
+def test_max_open_files(tmp_path):
+    """
+    Test that the least recently used log file is closed once max_open_files log files are open.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    """
+    logly = Logly(show_time=False, color_enabled=False, flush_interval=60, max_open_files=2)
+    logly.start_logging()
+
+    logly.info("Key1", "Value1", file_path=tmp_path / "a.txt")
+    logly.info("Key2", "Value2", file_path=tmp_path / "b.txt")
+    logly.info("Key3", "Value3", file_path=tmp_path / "a.txt")
+    logly.info("Key4", "Value4", file_path=tmp_path / "c.txt")
+
+    assert sorted(os.path.basename(file_path) for file_path in logly._file_handles) == ["a.txt", "c.txt"]
+    assert (tmp_path / "b.txt").read_text().splitlines() == ["INFO: Key2: Value2"]
+    logly.close()
+    assert (tmp_path / "a.txt").read_text().splitlines() == ["INFO: Key1: Value1", "INFO: Key3: Value3"]
+
+    with pytest.raises(InvalidConfigError):
+        Logly(buffer_size=1)
+    with pytest.raises(InvalidConfigError):
+        Logly(buffer_size=0)
+    with pytest.raises(InvalidConfigError):
+        Logly(max_open_files=0)
+
+def test_no_console(tmp_path, monkeypatch):
+    """
+    Test that messages are still logged to the log file when there is no console.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    - monkeypatch (MonkeyPatch): Removes sys.stdout for the test.
+    """
+    monkeypatch.setattr(sys, "stdout", None)
+    logly = Logly(show_time=False, color_enabled=False)
+    logly.start_logging()
+    log_path = tmp_path / "log.txt"
+
+    logly.info("Key1", "Value1", file_path=log_path)
+    logly.close()
+
+    assert log_path.read_text().splitlines() == ["INFO: Key1: Value1"]
+
+def test_closed_files_are_synced(tmp_path, monkeypatch):
+    """
+    Test that log files closed before the next sync, e.g. to open another one, are still synced to disk.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    - monkeypatch (MonkeyPatch): Records the synced files for the test.
+    """
+    synced = []
+    monkeypatch.setattr(os, "fsync", lambda fd: synced.append(os.fstat(fd).st_ino))
+    monkeypatch.setattr(os, "fdatasync", lambda fd: synced.append(os.fstat(fd).st_ino), raising=False)
+    logly = Logly(show_time=False, color_enabled=False, max_open_files=1)
+    logly.start_logging()
+
+    logly.info("Key1", "Value1", file_path=tmp_path / "a.txt")
+    logly.info("Key2", "Value2", file_path=tmp_path / "b.txt")
+    logly.flush(sync=True)
+
+    assert sorted(synced) == sorted([(tmp_path / "a.txt").stat().st_ino, (tmp_path / "b.txt").stat().st_ino])
+
+    # Already synced log files are closed without another sync
+    logly.close()
+    assert len(synced) == 2
+
+def test_set_level(capsys):
+    """
+    Test that messages below the minimum log level are skipped.
+
+    Parameters:
+    - capsys (CaptureFixture): Captures console output.
+    """
+    logly = Logly(show_time=False, color_enabled=False)
+    logly.set_level("WARNING")
+
+    logly.debug("Key1", "Value1", log_to_file=False)
+    logly.info("Key2", "Value2", log_to_file=False)
+    logly.warn("Key3", "Value3", log_to_file=False)
+    logly.fatal("Key4", "Value4", log_to_file=False)
+
+    assert capsys.readouterr().out.splitlines() == ["WARNING: Key3: Value3", "FATAL: Key4: Value4"]
+    assert not logly.is_enabled_for("INFO")
+    assert logly.is_enabled_for("ERROR")
+    assert logly.is_enabled_for("CUSTOM")
+    assert not logly.is_enabled_for("debug")
+    assert logly.is_enabled_for("error")
+    assert not logly.is_enabled_for(10)
+    assert logly.is_enabled_for(30)
+    assert logly.is_enabled_for(None)
+    logly.log_function(None, "Key0", "Value0", log_to_file=False)
+    assert capsys.readouterr().out.splitlines() == ["None: Key0: Value0"]
+
+    logly.set_level("error")
+    assert logly.level == "ERROR"
+    logly.warn("Key5", "Value5", log_to_file=False)
+    logly.set_level(10)
+    assert logly.level == "DEBUG"
+    logly.debug("Key6", "Value6", log_to_file=False)
+
+    assert capsys.readouterr().out.splitlines() == ["DEBUG: Key6: Value6"]
+
+    # Setting the level attribute works like set_level()
+    logly.level = "error"
+    assert logly.level == "ERROR"
+    assert not logly.is_enabled_for("INFO")
+    logly.info("Key7", "Value7", log_to_file=False)
+    assert capsys.readouterr().out == ""
+
+    with pytest.raises(InvalidLogLevelError):
+        logly.set_level("VERBOSE")
+    with pytest.raises(InvalidLogLevelError):
+        logly.set_level(15)
+    with pytest.raises(InvalidLogLevelError):
+        logly.set_level(["INFO"])
+    with pytest.raises(InvalidLogLevelError):
+        logly.level = "VERBOSE"
+
+
+def test_info_many(tmp_path):
+    """
+    Test logging several messages with the INFO level in one call.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    """
+    logly = Logly(show_time=False, color_enabled=False)
+    logly.start_logging()
+    log_path = tmp_path / "log.txt"
+
+    logly.info_many(["Value1", ("Key2", "Value2"), (1, 2, 3), ("Value4", None)], file_path=log_path)
+    logly.info("Value5", None, file_path=log_path)
+    logly.close()
+
+    assert log_path.read_text().splitlines() == ["INFO: None: Value1", "INFO: Key2: Value2", "INFO: None: (1, 2, 3)",
+                                                 "INFO: None: Value4", "INFO: None: Value5"]
+
+    # Closed log files are opened again by the next message
+    logly.info("Key3", "Value3", file_path=log_path)
+    logly.close()
+
+    assert log_path.read_text().splitlines()[-1] == "INFO: Key3: Value3"
+
+
+def test_max_file_size_numbered_file(tmp_path):
+    """
+    Test that messages go to the next free numbered file once the log file reaches max_file_size.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    """
+    logly = Logly(show_time=False, color_enabled=False)
+    logly.start_logging()
+    log_path = tmp_path / "log.txt"
+    (tmp_path / "log_1.txt").write_text("")
+    max_file_size = 30 / (1024 * 1024)  # 30 bytes
+
+    logly.info("Key1", "Value1", file_path=log_path, max_file_size=max_file_size, auto=False)
+    logly.info("Key2", "Value2", file_path=log_path, max_file_size=max_file_size, auto=False)
+    logly.info("Key3", "Value3", file_path=log_path, max_file_size=max_file_size, auto=False)
+    logly.info("Key4", "Value4", file_path=log_path, max_file_size=max_file_size, auto=False)
+    logly.info("Key5", "Value5", file_path=log_path, max_file_size=max_file_size, auto=False)
+    logly.flush()
+
+    assert log_path.read_text().splitlines() == ["INFO: Key1: Value1", "INFO: Key2: Value2"]
+    assert (tmp_path / "log_1.txt").read_text() == ""
+    assert (tmp_path / "log_2.txt").read_text().splitlines() == ["INFO: Key3: Value3", "INFO: Key4: Value4"]
+    assert (tmp_path / "log_3.txt").read_text().splitlines() == ["INFO: Key5: Value5"]
+
+
+def test_numbered_file_path_ignores_case(tmp_path, monkeypatch):
+    """
+    Test that numbered file names differing only in case are taken on case-insensitive file systems.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    - monkeypatch (MonkeyPatch): Makes path names compare case-insensitively for the test.
+    """
+    monkeypatch.setattr(os.path, "normcase", str.lower)
+    (tmp_path / "LOG_1.TXT").write_text("")
+    logly = Logly()
+
+    assert logly._get_numbered_file_path(str(tmp_path / "log.txt")) == str(tmp_path / "log_2.txt")
+
+
+def test_max_file_size_closes_full_files(tmp_path, monkeypatch):
+    """
+    Test that full log files are closed when messages move on to the next numbered file, without checking the
+    closed log file again.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    - monkeypatch (MonkeyPatch): Counts the file system calls for the test.
+    """
+    logly = Logly(show_time=False, color_enabled=False)
+    logly.start_logging()
+    log_path = tmp_path / "log.txt"
+    max_file_size = 30 / (1024 * 1024)  # 30 bytes
+    calls = []
+    makedirs, getsize = os.makedirs, os.path.getsize
+    monkeypatch.setattr(os, "makedirs", lambda *args, **kwargs: calls.append("makedirs") or makedirs(*args, **kwargs))
+    monkeypatch.setattr(os.path, "getsize", lambda path: calls.append("getsize") or getsize(path))
+
+    for count in range(20):
+        logly.info("Key", f"Value{count:02}", file_path=log_path, max_file_size=max_file_size, auto=False)
+        assert len(logly._file_handles) == 1
+    logly.close()
+
+    # The directory is set up once and each log file is only sized when it is opened
+    assert calls.count("makedirs") == 1
+    assert calls.count("getsize") == 10
+    assert len(list(tmp_path.iterdir())) == 10
+    assert (tmp_path / "log_9.txt").read_text().splitlines() == ["INFO: Key: Value18", "INFO: Key: Value19"]
+
+def test_max_file_size_counts_buffered_messages(tmp_path):
+    """
+    Test that the max_file_size check counts buffered messages without flushing them to the log file.
+
+    Parameters:
+    - tmp_path (Path): Temporary directory provided by pytest.
+    """
+    logly = Logly(show_time=False, color_enabled=False, flush_interval=60)
+    logly.start_logging()
+    log_path = tmp_path / "log.txt"
+    max_file_size = 30 / (1024 * 1024)  # 30 bytes
+
+    logly.info("Key1", "Value1", file_path=log_path, max_file_size=max_file_size)
+    logly.info("Key2", "Value2", file_path=log_path, max_file_size=max_file_size)
+    assert log_path.read_text() == ""
+
+    # The buffered messages already reach the limit, so the log file is truncated before the next one
+    logly.info("Key3", "Value3", file_path=log_path, max_file_size=max_file_size)
+    logly.flush()
 
+    assert log_path.read_text().splitlines() == ["INFO: Key3: Value3"]